@@ -1,27 +1,96 @@
 #!/usr/bin/env python3
 """Excel workbook reader for Claude Code. Streams large files efficiently."""
 
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import os
+import posixpath
+import re
 import subprocess
 import sys
+import xml.etree.ElementTree as ET
+import zipfile
+from datetime import datetime, date, time
+from functools import lru_cache
+from itertools import islice, zip_longest
 
-def ensure_openpyxl():
-    try:
-        import openpyxl  # noqa: F401
-    except ImportError:
-        print("Installing openpyxl...", file=sys.stderr)
-        subprocess.check_call(
-            [sys.executable, "-m", "pip", "install", "openpyxl", "-q"],
-            stdout=sys.stderr, stderr=sys.stderr,
-        )
+# (import name, pip package, required). Optional packages only speed things up.
+DEPENDENCIES = [
+    ("openpyxl", "openpyxl", True),
+    ("lxml", "lxml", False),
+    ("orjson", "orjson", False),
+    ("python_calamine", "python-calamine", False),
+]
 
-ensure_openpyxl()
 
-import argparse
-import json
-import os
-from datetime import datetime, date, time
+def pip_install(packages):
+    print(f"Installing {', '.join(packages)}...", file=sys.stderr)
+    return subprocess.call(
+        [sys.executable, "-m", "pip", "install", "-q", "--disable-pip-version-check", *packages],
+        stdout=sys.stderr, stderr=sys.stderr,
+    )
+
 
-import openpyxl
+def failed_installs_path():
+    # One record per interpreter, since each has its own site-packages
+    key = hashlib.sha1(sys.executable.encode()).hexdigest()[:12]
+    cache = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(cache, "excel-reader", f"failed-installs-{key}")
+
+
+def read_failed_installs():
+    try:
+        with open(failed_installs_path()) as f:
+            return set(f.read().split())
+    except OSError:
+        return set()
+
+
+def write_failed_installs(packages):
+    path = failed_installs_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as f:
+            f.write("\n".join(sorted(packages)) + "\n")
+    except OSError:
+        pass
+
+
+def ensure_deps():
+    # find_spec locates modules without importing them, so nothing is loaded twice
+    missing = [(module, package, required) for module, package, required in DEPENDENCIES
+               if importlib.util.find_spec(module) is None]
+    if not missing:
+        return
+    # Optional packages that failed to install before are not retried on every run
+    failed = read_failed_installs()
+    required = [package for _, package, req in missing if req]
+    optional = [package for _, package, req in missing if not req and package not in failed]
+    if required and pip_install(required) != 0:
+        sys.exit("Error: could not install " + ", ".join(required))
+    # One pip run for all optional packages; retry one by one so a failure only costs that package
+    if optional and pip_install(optional) != 0 and len(optional) > 1:
+        for package in optional:
+            pip_install([package])
+    importlib.invalidate_caches()
+    still_missing = {package for module, package, req in missing
+                     if not req and package in optional and importlib.util.find_spec(module) is None}
+    if still_missing:
+        print(f"Continuing without {', '.join(sorted(still_missing))}; "
+              f"delete {failed_installs_path()} to retry the install.", file=sys.stderr)
+        write_failed_installs(failed | still_missing)
+
+
+# Third-party modules are imported on first use: openpyxl alone costs more to
+# import than a small command takes to run.
+@lru_cache(maxsize=None)
+def load_optional(module):
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        return None
 
 
 def die(msg):
@@ -29,110 +98,319 @@ def die(msg):
     sys.exit(1)
 
 
+def format_float(value):
+    # is_integer() avoids building an int just to compare; repr() is str() without the wrapper
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+# Keyed by exact type: bool is listed explicitly so it never shares int's entry.
+CELL_FORMATTERS = {
+    type(None): lambda value: "",
+    str: str,
+    int: str,
+    bool: str,
+    float: format_float,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+}
+
+
 def format_cell(value):
-    if value is None:
-        return ""
+    return CELL_FORMATTERS.get(type(value), str)(value)
+
+
+def format_row(row):
+    # Inlines format_cell to save a Python call per cell
+    get = CELL_FORMATTERS.get
+    return [get(type(v), str)(v) for v in row]
+
+
+def json_default(value):
     if isinstance(value, (datetime, date, time)):
         return value.isoformat()
-    if isinstance(value, bool):
-        return str(value)
-    if isinstance(value, float):
-        if value == int(value):
-            return str(int(value))
-        return str(value)
     return str(value)
 
 
+def dump_json(obj):
+    orjson = load_optional("orjson")
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            # e.g. ints wider than 64 bits; stdlib json handles anything the old output did
+            pass
+        else:
+            sys.stdout.flush()
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+            return
+    import json
+    print(json.dumps(obj, indent=2, default=json_default))
+
+
+def write_json_line(obj):
+    orjson = load_optional("orjson")
+    if orjson is not None:
+        try:
+            sys.stdout.buffer.write(orjson.dumps(obj, default=str, option=orjson.OPT_APPEND_NEWLINE))
+            return
+        except orjson.JSONEncodeError:
+            pass
+    import json
+    sys.stdout.flush()
+    # Keep line order: earlier lines went to the binary buffer, so write through it too
+    sys.stdout.buffer.write((json.dumps(obj, default=json_default) + "\n").encode())
+
+
 def resolve_sheet(wb, name):
     if name is None:
         return wb[wb.sheetnames[0]]
-    lower = name.lower()
-    for sn in wb.sheetnames:
-        if sn.lower() == lower:
-            return wb[sn]
+    by_lower = {sn.lower(): sn for sn in reversed(wb.sheetnames)}
+    if name.lower() in by_lower:
+        return wb[by_lower[name.lower()]]
     available = ", ".join(wb.sheetnames)
     die(f"Sheet '{name}' not found. Available: {available}")
 
 
-def open_workbook(path):
+def identity(value):
+    return value
+
+
+def int_if_integral(value):
+    # Only floats that are exact integers (up to 2**53) become int; larger ones such as
+    # 1e20 stay float, as openpyxl returns them, and also fit JSON number handling
+    return int(value) if value.is_integer() and abs(value) <= 2**53 else value
+
+
+# Coerce calamine values to what openpyxl returns for the same cells: whole
+# numbers as int, empty cells as None and date-formatted cells as datetime.
+CALAMINE_NORMALIZERS = {
+    float: int_if_integral,
+    str: lambda value: value or None,
+    date: lambda value: datetime.combine(value, time()),
+}
+
+
+def normalize_calamine_row(row):
+    get = CALAMINE_NORMALIZERS.get
+    return [get(type(v), identity)(v) for v in row]
+
+
+class CalamineWorksheet:
+    """python-calamine sheet exposing the read-only openpyxl worksheet API used here."""
+
+    def __init__(self, sheet):
+        self.sheet = sheet
+        self.title = sheet.name
+
+    @property
+    def max_row(self):
+        return self.sheet.end[0] + 1 if self.sheet.end else 0
+
+    @property
+    def max_column(self):
+        return self.sheet.end[1] + 1 if self.sheet.end else 0
+
+    def iter_rows(self, min_row=1, max_row=None, values_only=True):
+        # Rows and columns are anchored at A1 like openpyxl. A falsy max_row means
+        # unbounded, as in openpyxl; a min_row below 1 starts at the first row.
+        rows = self.sheet.to_python(skip_empty_area=False, nrows=max_row or None)
+        return map(normalize_calamine_row, islice(rows, max(min_row - 1, 0), None))
+
+
+class CalamineWorkbook:
+    """python-calamine workbook exposing the read-only openpyxl workbook API used here."""
+
+    def __init__(self, python_calamine, path):
+        self.workbook = python_calamine.CalamineWorkbook.from_path(path)
+        self.sheetnames = self.workbook.sheet_names
+
+    def __getitem__(self, name):
+        return CalamineWorksheet(self.workbook.get_sheet_by_name(name))
+
+    def close(self):
+        self.workbook.close()
+
+
+def check_path(path):
     if not os.path.isfile(path):
         die(f"File not found: {path}")
     if path.lower().endswith(".xls") and not path.lower().endswith(".xlsx"):
         die("Legacy .xls format not supported. Convert to .xlsx first.")
+
+
+def open_workbook(path, metadata_only=False):
+    """Open a workbook for reading.
+
+    metadata_only skips python-calamine, which parses a whole sheet on access,
+    for callers that only need sheet names and dimensions.
+    """
+    check_path(path)
+    # Prefer the Rust reader; openpyxl handles .xlsm and anything calamine rejects
+    python_calamine = None if metadata_only else load_optional("python_calamine")
+    if python_calamine is not None and not path.lower().endswith(".xlsm"):
+        try:
+            return CalamineWorkbook(python_calamine, path)
+        except Exception:
+            pass
+    import openpyxl
+    from openpyxl.xml import LXML
+    if not LXML:
+        print("Warning: lxml is not installed; openpyxl falls back to the slower stdlib XML parser.", file=sys.stderr)
     try:
-        return openpyxl.load_workbook(path, read_only=True, data_only=True)
+        try:
+            # Skip external links and VBA parts entirely
+            return openpyxl.load_workbook(path, read_only=True, data_only=True,
+                                          keep_links=False, keep_vba=False, rich_text=False)
+        except TypeError:
+            # openpyxl < 3.1 has no rich_text argument
+            return openpyxl.load_workbook(path, read_only=True, data_only=True, keep_links=False, keep_vba=False)
     except Exception as e:
         die(f"Cannot open file: {e}")
 
 
+DIMENSION_RE = re.compile(r"^\$?([A-Z]+)\$?(\d+)(?::\$?([A-Z]+)\$?(\d+))?$")
+
+
+def parse_dimension(ref):
+    """Return (max_row, max_column) for a dimension ref such as "A1:F201"."""
+    m = DIMENSION_RE.match(ref.upper())
+    if not m:
+        raise ValueError(f"Invalid dimension '{ref}'")
+    letters = m.group(3) or m.group(1)
+    cols = 0
+    for ch in letters:
+        cols = cols * 26 + ord(ch) - ord("A") + 1
+    return int(m.group(4) or m.group(2)), cols
+
+
+def sheet_dimensions(ws):
+    # Read-only worksheets take this from the sheet's <dimension> tag; never force a scan
+    try:
+        return parse_dimension(ws.calculate_dimension(force=False))
+    except (ValueError, AttributeError):  # unsized, or a chartsheet
+        return "unknown", "unknown"
+
+
+def local_name(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def read_sheet_dimensions(path):
+    """List (name, max_row, max_column) straight from the .xlsx zip.
+
+    Only xl/workbook.xml, its rels and the head of each worksheet up to the
+    <dimension> tag are parsed. Raises on anything unexpected so callers can
+    fall back to openpyxl.
+    """
+    with zipfile.ZipFile(path) as z:
+        targets = {}
+        for rel in ET.fromstring(z.read("xl/_rels/workbook.xml.rels")):
+            target = rel.get("Target")
+            targets[rel.get("Id")] = target.lstrip("/") if target.startswith("/") else posixpath.normpath("xl/" + target)
+
+        sheets = []
+        for elem in ET.fromstring(z.read("xl/workbook.xml")).iter():
+            if local_name(elem.tag) != "sheet":
+                continue
+            rel_id = next(v for k, v in elem.attrib.items() if local_name(k) == "id")
+            rows, cols = "unknown", "unknown"
+            with z.open(targets[rel_id]) as f:
+                for _, el in ET.iterparse(f, events=("start",)):
+                    tag = local_name(el.tag)
+                    if tag == "dimension":
+                        rows, cols = parse_dimension(el.get("ref"))
+                        break
+                    if tag == "sheetData":
+                        break
+            sheets.append((elem.get("name"), rows, cols))
+    return sheets
+
+
+# Surrounding spaces and a leading "+" on each bound are allowed, as int() allowed them
+RANGE_RE = re.compile(r"^\s*\+?(\d+)\s*(?:-\s*\+?(\d+)\s*)?$")
+
+
 def parse_range(range_str):
     if range_str is None:
         return None, None
-    if "-" in range_str:
-        parts = range_str.split("-", 1)
-        try:
-            start = int(parts[0])
-            end = int(parts[1])
-        except ValueError:
-            die(f"Invalid range '{range_str}'. Use N or N-M (e.g., 10, 10-20)")
-        if start < 1 or end < start:
-            die(f"Invalid range '{range_str}'. Start must be >= 1 and end >= start.")
-        return start, end
-    try:
-        n = int(range_str)
-        if n < 1:
-            die(f"Row number must be >= 1, got {n}")
-        return n, n
-    except ValueError:
+    m = RANGE_RE.match(range_str)
+    if not m:
         die(f"Invalid range '{range_str}'. Use N or N-M (e.g., 10, 10-20)")
+    start = int(m.group(1))
+    if m.group(2) is None:
+        if start < 1:
+            die(f"Row number must be >= 1, got {start}")
+        return start, start
+    end = int(m.group(2))
+    if start < 1 or end < start:
+        die(f"Invalid range '{range_str}'. Start must be >= 1 and end >= start.")
+    return start, end
 
 
 def read_header_row(ws, header_row):
-    for i, row in enumerate(ws.iter_rows(min_row=header_row, max_row=header_row, values_only=True), start=1):
-        return [format_cell(c) for c in row]
-    return []
+    row = next(ws.iter_rows(min_row=header_row, max_row=header_row, values_only=True), None)
+    return format_row(row) if row is not None else []
+
+
+def record_keys(headers):
+    return ["_row"] + [h if h else f"col_{i}" for i, h in enumerate(headers)]
+
+
+def row_record(keys, row_num, vals):
+    # Pad short rows; cells beyond the headers are dropped by zip
+    missing = len(keys) - 1 - len(vals)
+    if missing > 0:
+        vals = (*vals, *(None,) * missing)
+    return dict(zip(keys, (row_num, *vals)))
+
+
+@lru_cache(maxsize=256)
+def dashes(width):
+    # Separator cell for a column of this width; wide tables repeat the same widths
+    return "-" * (width + 2)
 
 
 def print_markdown_table(columns, rows, footer=None):
-    col_widths = [len(str(c)) for c in columns]
-    str_rows = []
-    for row in rows:
-        str_row = [str(v) for v in row]
-        str_rows.append(str_row)
-        for i, v in enumerate(str_row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(v))
+    columns = [str(c) for c in columns]
+    str_rows = [list(map(str, row)) for row in rows]
+    # Column-wise max over all rows; short rows are padded, cells beyond the headers ignored
+    col_widths = [
+        max(map(len, col))
+        for col in islice(zip_longest(columns, *str_rows, fillvalue=""), len(columns))
+    ]
 
     def fmt_row(vals):
-        parts = []
-        for i, v in enumerate(vals):
-            w = col_widths[i] if i < len(col_widths) else len(v)
-            parts.append(str(v).ljust(w))
-        return "| " + " | ".join(parts) + " |"
-
-    print(fmt_row(columns))
-    print("|" + "|".join("-" * (w + 2) for w in col_widths) + "|")
-    for row in str_rows:
-        print(fmt_row(row))
+        # Cells beyond the known widths are emitted as-is
+        cells = [v.ljust(w) for v, w in zip(vals, col_widths)] + vals[len(col_widths):]
+        return "| " + " | ".join(cells) + " |"
 
+    lines = [fmt_row(columns), "|" + "|".join(map(dashes, col_widths)) + "|"]
+    lines.extend(map(fmt_row, str_rows))
     if footer:
-        print(f"\n{footer}")
+        lines += ["", footer]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # --- Commands ---
 
 def cmd_sheets(args):
-    wb = open_workbook(args.file)
-    sheets = []
-    for name in wb.sheetnames:
-        ws = wb[name]
-        rows = ws.max_row if ws.max_row else "unknown"
-        cols = ws.max_column if ws.max_column else "unknown"
-        sheets.append({"index": wb.sheetnames.index(name), "name": name, "rows": rows, "columns": cols})
-    wb.close()
+    check_path(args.file)
+    try:
+        found = read_sheet_dimensions(args.file)
+    except Exception:
+        # Not a plain .xlsx zip we understand; let openpyxl read it (and report errors)
+        wb = open_workbook(args.file, metadata_only=True)
+        found = [(name, *sheet_dimensions(wb[name])) for name in wb.sheetnames]
+        wb.close()
+    sheets = [{"index": idx, "name": name, "rows": rows, "columns": cols}
+              for idx, (name, rows, cols) in enumerate(found)]
 
     if args.json:
-        print(json.dumps({"file": args.file, "sheets": sheets}, indent=2, default=str))
+        dump_json({"file": args.file, "sheets": sheets})
     else:
         columns = ["#", "Sheet Name", "Rows", "Columns"]
         rows = [[s["index"] + 1, s["name"], s["rows"], s["columns"]] for s in sheets]
@@ -144,9 +422,10 @@ def cmd_headers(args):
     ws = resolve_sheet(wb, args.sheet)
     num_rows = args.rows
 
-    collected = []
-    for i, row in enumerate(ws.iter_rows(min_row=1, max_row=num_rows, values_only=True), start=1):
-        collected.append((i, [format_cell(c) for c in row]))
+    # JSON keeps the reader's native row as-is; the serializer handles dates and numbers
+    convert = (lambda row: row) if args.json else format_row
+    rows_iter = ws.iter_rows(min_row=1, max_row=num_rows, values_only=True)
+    collected = [(i, convert(row)) for i, row in enumerate(rows_iter, start=1)]
     wb.close()
 
     if not collected:
@@ -157,7 +436,7 @@ def cmd_headers(args):
             "sheet": ws.title,
             "rows": [{"_row": r, "values": vals} for r, vals in collected],
         }
-        print(json.dumps(result, indent=2))
+        dump_json(result)
     else:
         max_cols = max(len(vals) for _, vals in collected)
         col_headers = ["Row"] + [f"Col {i}" for i in range(1, max_cols + 1)]
@@ -189,15 +468,21 @@ def cmd_rows(args):
     if start_row <= header_row:
         start_row = header_row + 1
 
-    collected = []
-    count = 0
-    for row in ws.iter_rows(min_row=start_row, values_only=True):
-        if range_end is not None and start_row + count > range_end:
-            break
-        collected.append((start_row + count, [format_cell(c) for c in row]))
-        count += 1
-        if count >= limit:
-            break
+    # Bound the read so the parser stops after the requested rows
+    max_row = range_end if range_end is not None else start_row + limit - 1
+
+    if args.ndjson:
+        # Metadata record first, then each row as soon as it is read
+        write_json_line({"sheet": ws.title, "headers": headers, "total_rows": ws.max_row})
+        keys = record_keys(headers)
+        for row_num, row in enumerate(ws.iter_rows(min_row=start_row, max_row=max_row, values_only=True), start=start_row):
+            write_json_line(row_record(keys, row_num, row))
+        wb.close()
+        return
+
+    convert = (lambda row: row) if args.json else format_row
+    rows_iter = ws.iter_rows(min_row=start_row, max_row=max_row, values_only=True)
+    collected = [(row_num, convert(row)) for row_num, row in enumerate(rows_iter, start=start_row)]
 
     total = ws.max_row
     wb.close()
@@ -207,19 +492,15 @@ def cmd_rows(args):
         return
 
     if args.json:
+        keys = record_keys(headers)
         result = {
             "sheet": ws.title,
             "headers": headers,
-            "rows": [],
+            "rows": [row_record(keys, row_num, vals) for row_num, vals in collected],
             "total_rows": total,
             "showing": len(collected),
         }
-        for row_num, vals in collected:
-            obj = {"_row": row_num}
-            for i, h in enumerate(headers):
-                obj[h if h else f"col_{i}"] = vals[i] if i < len(vals) else ""
-            result["rows"].append(obj)
-        print(json.dumps(result, indent=2))
+        dump_json(result)
     else:
         col_headers = ["Row"] + headers
         rows = [[r] + vals + [""] * (len(headers) - len(vals)) for r, vals in collected]
@@ -244,32 +525,41 @@ def cmd_column(args):
     col_name = args.column
 
     # Try case-insensitive name match
-    lower_headers = [h.lower() for h in headers]
-    if col_name.lower() in lower_headers:
-        col_idx = lower_headers.index(col_name.lower())
+    # Built in reverse so the first of any duplicate headers wins
+    index_by_lower = {h.lower(): i for i, h in reversed(list(enumerate(headers)))}
+    col_idx = index_by_lower.get(col_name.lower())
+    if col_idx is not None:
         col_name = headers[col_idx]
     else:
-        # Try as integer index
+        # Try as integer index; only reached once the name lookup has missed
         try:
             idx = int(col_name)
-            if 0 <= idx < len(headers):
-                col_idx = idx
-                col_name = headers[col_idx]
-            else:
-                die(f"Column index {idx} out of range (0-{len(headers) - 1}). Available: {', '.join(headers)}")
         except ValueError:
             die(f"Column '{col_name}' not found. Available: {', '.join(headers)}")
+        if 0 <= idx < len(headers):
+            col_idx = idx
+            col_name = headers[col_idx]
+        else:
+            die(f"Column index {idx} out of range (0-{len(headers) - 1}). Available: {', '.join(headers)}")
 
     # Stream column data
     start_row = header_row + 1 + args.offset
+    max_row = start_row + args.limit - 1
+
+    if args.ndjson:
+        write_json_line({"sheet": ws.title, "column": col_name, "column_index": col_idx, "total_rows": ws.max_row})
+        for row_num, row in enumerate(ws.iter_rows(min_row=start_row, max_row=max_row, values_only=True), start=start_row):
+            write_json_line({"_row": row_num, "value": row[col_idx] if col_idx < len(row) else None})
+        wb.close()
+        return
+
     collected = []
-    count = 0
-    for row in ws.iter_rows(min_row=start_row, values_only=True):
-        val = format_cell(row[col_idx]) if col_idx < len(row) else ""
-        collected.append((start_row + count, val))
-        count += 1
-        if count >= args.limit:
-            break
+    for row_num, row in enumerate(ws.iter_rows(min_row=start_row, max_row=max_row, values_only=True), start=start_row):
+        if col_idx < len(row):
+            val = row[col_idx] if args.json else format_cell(row[col_idx])
+        else:
+            val = None if args.json else ""
+        collected.append((row_num, val))
 
     total = ws.max_row
     wb.close()
@@ -287,7 +577,7 @@ def cmd_column(args):
             "total_rows": total,
             "showing": len(collected),
         }
-        print(json.dumps(result, indent=2))
+        dump_json(result)
     else:
         col_headers = ["Row", col_name]
         rows = [[r, v] for r, v in collected]
@@ -296,6 +586,20 @@ def cmd_column(args):
         print_markdown_table(col_headers, rows, footer=footer)
 
 
+def positive_int(value):
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be >= 1, got {n}")
+    return n
+
+
+def non_negative_int(value):
+    n = int(value)
+    if n < 0:
+        raise argparse.ArgumentTypeError(f"must be >= 0, got {n}")
+    return n
+
+
 def build_parser():
     parser = argparse.ArgumentParser(description="Excel workbook reader")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -309,7 +613,7 @@ def build_parser():
     p = sub.add_parser("headers", help="Show header rows")
     p.add_argument("file", help="Path to Excel file")
     p.add_argument("--sheet", default=None, help="Sheet name (case-insensitive)")
-    p.add_argument("--rows", type=int, default=1, help="Number of rows to show (default: 1)")
+    p.add_argument("--rows", type=positive_int, default=1, help="Number of rows to show (default: 1)")
     p.add_argument("--json", action="store_true", help="Output as JSON")
 
     # rows
@@ -317,20 +621,24 @@ def build_parser():
     p.add_argument("file", help="Path to Excel file")
     p.add_argument("range", nargs="?", default=None, help="Row range: N or N-M (1-based)")
     p.add_argument("--sheet", default=None, help="Sheet name (case-insensitive)")
-    p.add_argument("--limit", type=int, default=50, help="Max rows to return (default: 50)")
-    p.add_argument("--offset", type=int, default=0, help="Skip N data rows")
-    p.add_argument("--header-row", type=int, default=1, help="Row containing headers (default: 1)")
-    p.add_argument("--json", action="store_true", help="Output as JSON")
+    p.add_argument("--limit", type=positive_int, default=50, help="Max rows to return (default: 50)")
+    p.add_argument("--offset", type=non_negative_int, default=0, help="Skip N data rows")
+    p.add_argument("--header-row", type=positive_int, default=1, help="Row containing headers (default: 1)")
+    fmt = p.add_mutually_exclusive_group()
+    fmt.add_argument("--json", action="store_true", help="Output as JSON")
+    fmt.add_argument("--ndjson", action="store_true", help="Stream one JSON object per line (first line is metadata)")
 
     # column
     p = sub.add_parser("column", help="Extract a column")
     p.add_argument("file", help="Path to Excel file")
     p.add_argument("column", help="Column name (case-insensitive) or 0-based index")
     p.add_argument("--sheet", default=None, help="Sheet name (case-insensitive)")
-    p.add_argument("--limit", type=int, default=50, help="Max rows to return (default: 50)")
-    p.add_argument("--offset", type=int, default=0, help="Skip N data rows")
-    p.add_argument("--header-row", type=int, default=1, help="Row containing headers (default: 1)")
-    p.add_argument("--json", action="store_true", help="Output as JSON")
+    p.add_argument("--limit", type=positive_int, default=50, help="Max rows to return (default: 50)")
+    p.add_argument("--offset", type=non_negative_int, default=0, help="Skip N data rows")
+    p.add_argument("--header-row", type=positive_int, default=1, help="Row containing headers (default: 1)")
+    fmt = p.add_mutually_exclusive_group()
+    fmt.add_argument("--json", action="store_true", help="Output as JSON")
+    fmt.add_argument("--ndjson", action="store_true", help="Stream one JSON object per line (first line is metadata)")
 
     return parser
 
@@ -338,6 +646,10 @@ def build_parser():
 def main():
     parser = build_parser()
     args = parser.parse_args()
+    ensure_deps()
+
+    # Output goes out in a few large writes; don't flush on every newline when attached to a TTY
+    sys.stdout.reconfigure(line_buffering=False)
 
     commands = {
         "sheets": cmd_sheets,